@@ -0,0 +1,59 @@
+# Copyright 2026 The DMLab2D Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Functions for sampling random actions a block at a time."""
+
+from typing import Callable
+
+import numpy as np
+
+SAMPLE_BLOCK_SIZE = 4096
+
+
+def _make_block_sampler(
+    sample_block: Callable[[int], np.ndarray]) -> Callable[[], float]:
+  """Returns a function yielding one value from blocks drawn by `sample_block`.
+
+  Values are returned in the order they were drawn.
+
+  Args:
+    sample_block: Called with a size to draw a block of random values at once.
+  """
+  block = []
+
+  def function():
+    if not block:
+      block.extend(reversed(sample_block(SAMPLE_BLOCK_SIZE).tolist()))
+    return block.pop()
+
+  return function
+
+
+def make_int32_distribution(random: np.random.RandomState, minimum: int,
+                            maximum: int) -> Callable[[], int]:
+  """Returns a function sampling integers in [`minimum`, `maximum`]."""
+
+  def sample_block(size):
+    return random.randint(minimum, maximum + 1, size=size)
+
+  return _make_block_sampler(sample_block)
+
+
+def make_float64_distribution(random: np.random.RandomState, minimum: float,
+                              maximum: float) -> Callable[[], float]:
+  """Returns a function sampling floats in [`minimum`, `maximum`)."""
+
+  def sample_block(size):
+    return random.uniform(minimum, maximum, size=size)
+
+  return _make_block_sampler(sample_block)
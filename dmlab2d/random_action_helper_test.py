@@ -0,0 +1,51 @@
+# Copyright 2026 The DMLab2D Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS-IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for dmlab2d.random_action_helper."""
+
+from absl.testing import absltest
+import numpy as np
+
+from dmlab2d import random_action_helper
+
+
+class RandomActionHelperTest(absltest.TestCase):
+
+  def test_int32_distribution_in_range_and_refills(self):
+    sample = random_action_helper.make_int32_distribution(
+        np.random.RandomState(0), 2, 5)
+    values = [
+        sample() for _ in range(random_action_helper.SAMPLE_BLOCK_SIZE + 10)
+    ]
+    self.assertEqual(min(values), 2)
+    self.assertEqual(max(values), 5)
+
+  def test_float64_distribution_in_range_and_refills(self):
+    sample = random_action_helper.make_float64_distribution(
+        np.random.RandomState(0), -1.0, 1.0)
+    values = [
+        sample() for _ in range(random_action_helper.SAMPLE_BLOCK_SIZE + 10)
+    ]
+    self.assertGreaterEqual(min(values), -1.0)
+    self.assertLessEqual(max(values), 1.0)
+
+  def test_int32_distribution_keeps_draw_order(self):
+    sample = random_action_helper.make_int32_distribution(
+        np.random.RandomState(7), 0, 9)
+    expected = np.random.RandomState(7)
+    for _ in range(random_action_helper.SAMPLE_BLOCK_SIZE + 10):
+      self.assertEqual(sample(), expected.randint(0, 10))
+
+
+if __name__ == '__main__':
+  absltest.main()
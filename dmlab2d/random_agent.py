@@ -25,25 +25,10 @@ import numpy as np
 import pygame
 
 import dmlab2d
+from dmlab2d import random_action_helper
 from dmlab2d import runfiles_helper
 
 
-def _make_int32_distribution(random, minimum, maximum):
-
-  def function():
-    return random.randint(minimum, maximum + 1)
-
-  return function
-
-
-def _make_float64_distribution(random, minimum, maximum):
-
-  def function():
-    return random.uniform(minimum, maximum)
-
-  return function
-
-
 class PyGameRandomAgent(object):
   """Random agent works with int32 or float64 bounded actions."""
 
@@ -66,14 +51,18 @@ class PyGameRandomAgent(object):
     for name, spec in action_spec.items():
       if spec.dtype == np.dtype('int32'):
         self._actions.append(
-            (name, _make_int32_distribution(random, spec.minimum,
-                                            spec.maximum)))
+            (name,
+             random_action_helper.make_int32_distribution(
+                 random, spec.minimum, spec.maximum)))
       elif spec.dtype == np.dtype('float64'):
         self._actions.append(
-            (name, _make_float64_distribution(random, spec.minimum,
-                                              spec.maximum)))
+            (name,
+             random_action_helper.make_float64_distribution(
+                 random, spec.minimum, spec.maximum)))
       else:
         print("Warning '{}' is not supported".format(spec))
+    # Single-action specs (e.g. chase_eat and pushbox) skip the comprehension.
+    self._single_action = self._actions[0] if len(self._actions) == 1 else None
     obs_spec = observation_spec[observation_name]
     self._setup_py_game(obs_spec.shape)
 
@@ -107,6 +96,9 @@ class PyGameRandomAgent(object):
 
     if display_score_dirty:
       pygame.display.set_caption('%d score' % self._scores[-1])
+    if self._single_action is not None:
+      name, gen = self._single_action
+      return {name: gen()}
     return {name: gen() for name, gen in self._actions}
 
   def print_stats(self):
@@ -169,7 +161,13 @@ def main():
       '--settings', type=json.loads, default={}, help='Settings as JSON string')
   parser.add_argument(
       '--env_seed', type=int, default=0, help='Environment seed')
-  parser.add_argument('--agent_seed', type=int, default=0, help='Agent seed')
+  parser.add_argument(
+      '--agent_seed',
+      type=int,
+      default=0,
+      help=('Agent seed. Actions are drawn in blocks per action, so levels '
+            'with several actions (e.g. clean_up) produce different '
+            'sequences than earlier versions of this script'))
   parser.add_argument(
       '--num_episodes', type=int, default=1, help='Number of episodes')
   parser.add_argument(